@@ -0,0 +1 @@
+# Herramientas de medicion de rendimiento de AuditApp (no se cargan con la app).
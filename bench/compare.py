@@ -0,0 +1,52 @@
+# bench/compare.py
+# Compara dos resultados de bench/run.py (p. ej. main vs. rama) y marca las
+# regresiones que superen el umbral.
+#
+#   python -m bench.compare base.json nuevo.json --metric p50_ms --threshold 1.2
+import argparse
+import json
+import sys
+
+
+def compare(base, new, metric, threshold):
+    rows = []
+    regressions = 0
+    for size, scenarios in new['results'].items():
+        for name, stats in scenarios.items():
+            before = base['results'].get(size, {}).get(name, {}).get(metric)
+            after = stats.get(metric)
+            if before is None or after is None:
+                rows.append((size, name, before, after, None, ''))
+                continue
+            ratio = after / before if before else float('inf')
+            flag = 'REGRESION' if ratio > threshold else ('mejora' if ratio < 1 / threshold else '')
+            regressions += flag == 'REGRESION'
+            rows.append((size, name, before, after, ratio, flag))
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara dos archivos de bench/run.py")
+    parser.add_argument('base')
+    parser.add_argument('new')
+    parser.add_argument('--metric', default='p50_ms',
+                        help="mean_ms, p50_ms, p90_ms, p99_ms, peak_mem_kb u output_bytes")
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help="razon nuevo/base a partir de la cual se considera regresion")
+    args = parser.parse_args(argv)
+
+    with open(args.base) as fh:
+        base = json.load(fh)
+    with open(args.new) as fh:
+        new = json.load(fh)
+    rows, regressions = compare(base, new, args.metric, args.threshold)
+
+    print(f"{args.metric}: {base['meta'].get('commit')} -> {new['meta'].get('commit')}")
+    for size, name, before, after, ratio, flag in rows:
+        ratio_txt = f"{ratio:6.2f}x" if ratio is not None else "    - "
+        print(f"{size:>8} {name:<28} {before!s:>12} -> {after!s:>12}  {ratio_txt}  {flag}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# bench/concurrency.py
+# Varios procesos guardan respuestas de la misma empresa a la vez (POST a
+# /empresa/<id>/diligenciar) contra una base de datos compartida y se cuentan
+# los errores de bloqueo. Con SQLite en WAL + busy_timeout todos los
+# escritores deben terminar sin "database is locked".
+#
+#   python -m bench.concurrency --writers 8 --saves 25
+#   DATABASE_URL=postgresql://... python -m bench.concurrency
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load_app(workdir):
+    os.chdir(workdir)
+    sys.path.insert(0, ROOT)
+    import app as app_module
+    app_module.app.config['TESTING'] = True
+    return app_module
+
+
+def setup(workdir, writers, per_writer):
+    m = _load_app(workdir)
+    with m.app.app_context():
+        e = m.Empresa(nombre=f"concurrencia-{int(time.time() * 1000)}")
+        m.db.session.add(e)
+        m.db.session.commit()
+        m.import_questions(e.id, (f"Pregunta {i}" for i in range(writers * per_writer)))
+        ids = [q_id for (q_id,) in m.db.session.query(m.Question.id)
+               .filter(m.Question.empresa_id == e.id).order_by(m.Question.id)]
+        return e.id, ids
+
+
+def writer(args):
+    workdir, empresa_id, ids, saves, seed = args
+    m = _load_app(workdir)
+    client = m.app.test_client()
+    rng = random.Random(seed)
+    ok = locked = other = 0
+    latencies = []
+    for _ in range(saves):
+        form = {}
+        for q_id in rng.sample(ids, min(len(ids), 5)):
+            form[f'state_{q_id}'] = rng.choice(m.STATES)
+            form[f'obs_{q_id}'] = f"obs {rng.random():.6f}"
+        start = time.perf_counter()
+        try:
+            resp = client.post(f'/empresa/{empresa_id}/diligenciar', data=form)
+            if resp.status_code == 302:
+                ok += 1
+            else:
+                other += 1
+        except Exception as ex:
+            if 'locked' in str(ex):
+                locked += 1
+            else:
+                other += 1
+        latencies.append(time.perf_counter() - start)
+    return {'ok': ok, 'locked': locked, 'other_errors': other, 'latencies': latencies}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Escritores concurrentes sobre empresa_diligenciar")
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--saves', type=int, default=25, help="guardados por escritor")
+    parser.add_argument('--questions', type=int, default=50, help="preguntas por escritor")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix='auditapp-concurrency-')
+    if 'DATABASE_URL' not in os.environ:
+        os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'audit.db')}"
+
+    ctx = multiprocessing.get_context('spawn')
+    with ctx.Pool(1) as pool:
+        empresa_id, ids = pool.apply(setup, (workdir, args.writers, args.questions))
+
+    chunks = [ids[i::args.writers] for i in range(args.writers)]
+    jobs = [(workdir, empresa_id, chunks[i], args.saves, i) for i in range(args.writers)]
+    start = time.perf_counter()
+    with ctx.Pool(args.writers) as pool:
+        results = pool.map(writer, jobs)
+    wall = time.perf_counter() - start
+
+    latencies = sorted(lat for r in results for lat in r['latencies'])
+    summary = {
+        'database': os.environ['DATABASE_URL'].split('@')[-1],
+        'writers': args.writers,
+        'saves': sum(r['ok'] for r in results),
+        'locked_errors': sum(r['locked'] for r in results),
+        'other_errors': sum(r['other_errors'] for r in results),
+        'wall_s': round(wall, 3),
+        'p50_ms': round(latencies[len(latencies) // 2] * 1000, 1) if latencies else None,
+        'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1) if latencies else None,
+    }
+    print(json.dumps(summary, indent=2))
+    return 1 if summary['locked_errors'] or summary['other_errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
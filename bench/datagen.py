@@ -0,0 +1,123 @@
+# bench/datagen.py
+# Generador de datos sinteticos: empresas, preguntas con una distribucion de
+# estados parecida a la de auditorias reales y filas de AuditReport.
+#
+#   python -m bench.datagen --empresas 20 --questions 5000 --reports 3
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Estado -> peso relativo; None son preguntas aun sin responder
+STATE_WEIGHTS = [
+    ("Fortalezas", 45),
+    ("Observaciones", 20),
+    ("Hallazgos", 14),
+    ("No conformidad menor", 9),
+    ("No conformidad mayor", 4),
+    (None, 8),
+]
+
+CONTROLS = [
+    "respaldo de la información", "gestión de contraseñas", "control de acceso físico",
+    "registro de incidentes", "revisión de proveedores", "capacitación del personal",
+    "continuidad del negocio", "cifrado de datos", "gestión de cambios", "inventario de activos",
+]
+
+OBSERVATIONS = [
+    "Se evidencia el procedimiento documentado y aplicado.",
+    "El registro no está actualizado desde el último trimestre.",
+    "No se presentó evidencia durante la visita.",
+    "Se recomienda formalizar la responsabilidad del proceso.",
+    "",
+]
+
+
+def load_app(workdir=None, database_url=None):
+    # Importa app.py apuntando a una base de datos y carpetas de trabajo propias
+    workdir = workdir or tempfile.mkdtemp(prefix='auditapp-bench-')
+    if database_url is None and 'DATABASE_URL' not in os.environ:
+        database_url = f"sqlite:///{os.path.join(workdir, 'audit.db')}"
+    if database_url:
+        os.environ['DATABASE_URL'] = database_url
+    os.chdir(workdir)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    import app as app_module
+    app_module.app.config['TESTING'] = True
+    return app_module
+
+
+def question_text(rng, i):
+    control = rng.choice(CONTROLS)
+    return f"{i + 1}. ¿La organización tiene definido y aplica un control de {control} acorde con la norma?"
+
+
+def generate_empresa(m, nombre, questions, reports=1, seed=0, chunk_size=1000):
+    rng = random.Random(seed)
+    states = [s for s, _ in STATE_WEIGHTS]
+    weights = [w for _, w in STATE_WEIGHTS]
+    e = m.Empresa(nombre=nombre)
+    m.db.session.add(e)
+    m.db.session.commit()
+
+    insert_stmt = m.Question.__table__.insert()
+    chunk = []
+    for i in range(questions):
+        state = rng.choices(states, weights)[0]
+        chunk.append({
+            'text': question_text(rng, i),
+            'state': state,
+            'observation': rng.choice(OBSERVATIONS) if state else None,
+            'empresa_id': e.id,
+        })
+        if len(chunk) >= chunk_size:
+            m.db.session.execute(insert_stmt, chunk)
+            m.db.session.commit()
+            chunk = []
+    if chunk:
+        m.db.session.execute(insert_stmt, chunk)
+        m.db.session.commit()
+
+    for r in range(reports):
+        m.db.session.add(m.snapshot_report(m.AuditReport(
+            empresa_id=e.id, empresa_nombre=e.nombre,
+            auditor_nombre=f"Auditor {r + 1}",
+            auditor_text="Informe generado para pruebas de rendimiento.\nSin observaciones adicionales.",
+        )))
+    m.db.session.commit()
+    return e.id
+
+
+def generate(m, empresas, questions, reports=1, seed=0):
+    ids = []
+    stamp = int(time.time() * 1000)
+    for i in range(empresas):
+        ids.append(generate_empresa(m, f"Empresa sintética {stamp}-{i + 1}", questions, reports, seed + i))
+    return ids
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera datos sinteticos de auditoria")
+    parser.add_argument('--empresas', type=int, default=10)
+    parser.add_argument('--questions', type=int, default=1000, help="preguntas por empresa")
+    parser.add_argument('--reports', type=int, default=1, help="informes por empresa")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--database-url', default=None,
+                        help="por defecto DATABASE_URL o una base SQLite temporal")
+    args = parser.parse_args(argv)
+
+    m = load_app(database_url=args.database_url)
+    start = time.perf_counter()
+    with m.app.app_context():
+        ids = generate(m, args.empresas, args.questions, args.reports, args.seed)
+    print(f"{len(ids)} empresas x {args.questions} preguntas en {time.perf_counter() - start:.2f}s "
+          f"({os.environ['DATABASE_URL']})")
+
+
+if __name__ == '__main__':
+    main()
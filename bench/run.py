@@ -0,0 +1,190 @@
+# bench/run.py
+# Ejecuta las rutas reales con el cliente de pruebas de Flask sobre datos
+# sinteticos de distintos tamaños y guarda latencias (percentiles), memoria
+# pico (tracemalloc) y tamaño de la respuesta en un JSON comparable entre
+# commits con bench/compare.py.
+#
+#   python -m bench.run --sizes 10,1000,10000 --repeat 5 --output bench.json
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+
+from bench.datagen import ROOT, generate_empresa, load_app
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    k = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[k]
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def xlsx_upload(rows):
+    import openpyxl
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for i in range(rows):
+        ws.append([f"Pregunta importada {i + 1}"])
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+class Scenario:
+    # Una ruta a medir: prepare() se ejecuta antes de cada muestra (fuera del
+    # tiempo medido) y call() devuelve la respuesta.
+    def __init__(self, name, call, prepare=None, expect=200):
+        self.name = name
+        self.call = call
+        self.prepare = prepare
+        self.expect = expect
+
+
+def build_scenarios(m, client, empresa_id, report_id, size):
+    ids = [q_id for (q_id,) in m.db.session.query(m.Question.id)
+           .filter(m.Question.empresa_id == empresa_id).order_by(m.Question.id)]
+    touched = max(1, size // 20)
+    counter = {'n': 0}
+
+    def diligenciar_form():
+        # Cambia ~5% de las respuestas en cada guardado
+        counter['n'] += 1
+        form = {}
+        for q_id in ids[counter['n'] % max(1, len(ids))::max(1, len(ids) // touched)][:touched]:
+            form[f'state_{q_id}'] = m.STATES[(q_id + counter['n']) % len(m.STATES)]
+            form[f'obs_{q_id}'] = f"observación {counter['n']}"
+        return form
+
+    upload_bytes = xlsx_upload(size)
+    upload_empresa = {}
+
+    def prepare_upload():
+        e = m.Empresa(nombre=f"upload-{size}-{time.time_ns()}")
+        m.db.session.add(e)
+        m.db.session.commit()
+        upload_empresa['id'] = e.id
+
+    def drop_report_cache():
+        # Los informes se cachean bajo r<id>_
+        folder = m.app.config['REPORT_CACHE_FOLDER']
+        for name in os.listdir(folder):
+            if name.startswith(f"r{report_id}_"):
+                os.remove(os.path.join(folder, name))
+
+    return [
+        Scenario('empresa_questions', lambda: client.get(f'/empresa/{empresa_id}/preguntas')),
+        Scenario('empresa_diligenciar_post',
+                 lambda: client.post(f'/empresa/{empresa_id}/diligenciar', data=diligenciar_form()),
+                 expect=302),
+        Scenario('empresa_upload',
+                 lambda: client.post(f"/empresa/{upload_empresa['id']}/upload",
+                                     data={'file': (io.BytesIO(upload_bytes), 'preguntas.xlsx')},
+                                     content_type='multipart/form-data'),
+                 prepare=prepare_upload, expect=302),
+        Scenario('export_pdf_by_empresa',
+                 lambda: client.get(f'/empresa/{empresa_id}/report/pdf/{report_id}'),
+                 prepare=drop_report_cache),
+        Scenario('export_word_by_empresa',
+                 lambda: client.get(f'/empresa/{empresa_id}/report/word/{report_id}'),
+                 prepare=drop_report_cache),
+        Scenario('export_questions_excel', lambda: client.get(f'/empresa/{empresa_id}/export_excel')),
+    ]
+
+
+def measure(scenario, repeat):
+    latencies = []
+    size = None
+    for _ in range(repeat):
+        if scenario.prepare:
+            scenario.prepare()
+        start = time.perf_counter()
+        resp = scenario.call()
+        body = resp.get_data()
+        latencies.append(time.perf_counter() - start)
+        if resp.status_code != scenario.expect:
+            raise RuntimeError(f"{scenario.name}: HTTP {resp.status_code}")
+        size = len(body)
+
+    # Memoria pico en una ejecucion aparte: tracemalloc distorsiona el tiempo
+    if scenario.prepare:
+        scenario.prepare()
+    tracemalloc.start()
+    scenario.call().get_data()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'samples': len(latencies),
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 2),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p90_ms': round(percentile(latencies, 90) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'max_ms': round(max(latencies) * 1000, 2),
+        'peak_mem_kb': round(peak / 1024.0, 1),
+        'output_bytes': size,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de rutas de AuditApp")
+    parser.add_argument('--sizes', default='10,1000,10000',
+                        help="preguntas por empresa, separadas por coma (p. ej. 10,1000,100000)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--only', default=None, help="lista de escenarios a ejecutar, separada por coma")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_results.json')
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    only = set(args.only.split(',')) if args.only else None
+    output = os.path.abspath(args.output)
+    m = load_app()
+    results = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'database': m.app.config['SQLALCHEMY_DATABASE_URI'].split('@')[-1],
+            'repeat': args.repeat,
+        },
+        'results': {},
+    }
+    with m.app.app_context():
+        client = m.app.test_client()
+        for size in sizes:
+            t0 = time.perf_counter()
+            empresa_id = generate_empresa(m, f"bench-{size}-{time.time_ns()}", size, reports=1, seed=args.seed)
+            report_id = m.db.session.query(m.db.func.max(m.AuditReport.id)) \
+                .filter(m.AuditReport.empresa_id == empresa_id).scalar()
+            print(f"[{size} preguntas] datos generados en {time.perf_counter() - t0:.2f}s")
+            per_size = {}
+            for scenario in build_scenarios(m, client, empresa_id, report_id, size):
+                if only and scenario.name not in only:
+                    continue
+                per_size[scenario.name] = stats = measure(scenario, args.repeat)
+                print(f"  {scenario.name:<28} p50 {stats['p50_ms']:>10.2f} ms  p90 {stats['p90_ms']:>10.2f} ms  "
+                      f"pico {stats['peak_mem_kb']:>10.1f} KB  salida {stats['output_bytes']:>10} B")
+            results['results'][str(size)] = per_size
+
+    with open(output, 'w') as fh:
+        json.dump(results, fh, indent=2)
+    print(f"Resultados en {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# bench/startup.py
+# Mide el arranque de la aplicacion: tiempo de "import app", memoria residual
+# (RSS maxima) y que dependencias pesadas quedaron cargadas. Cada medicion se
+# hace en un proceso nuevo para que no haya modulos en cache.
+#
+#   python -m bench.startup --runs 5 --max-import-ms 800 --max-rss-mb 120
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ['reportlab', 'docx', 'openpyxl', 'matplotlib', 'PIL']
+
+PROBE = r'''
+import json, sys, time
+t0 = time.perf_counter()
+import app
+elapsed = time.perf_counter() - t0
+try:
+    import resource
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        rss_kb //= 1024
+except ImportError:
+    rss_kb = None
+heavy = [m for m in %r if m in sys.modules]
+print(json.dumps({'import_s': elapsed, 'rss_kb': rss_kb, 'heavy_loaded': heavy}))
+''' % (HEAVY_MODULES,)
+
+
+def measure_once():
+    out = subprocess.run([sys.executable, '-c', PROBE], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def measure(runs):
+    samples = [measure_once() for _ in range(runs)]
+    import_ms = [s['import_s'] * 1000.0 for s in samples]
+    rss = [s['rss_kb'] for s in samples if s['rss_kb'] is not None]
+    return {
+        'runs': runs,
+        'import_ms_median': round(statistics.median(import_ms), 1),
+        'import_ms_min': round(min(import_ms), 1),
+        'import_ms_max': round(max(import_ms), 1),
+        'rss_mb_median': round(statistics.median(rss) / 1024.0, 1) if rss else None,
+        'heavy_loaded': sorted({m for s in samples for m in s['heavy_loaded']}),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tiempo de importacion y RSS base de app.py")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-import-ms', type=float, default=None,
+                        help="falla si la mediana supera este tiempo")
+    parser.add_argument('--max-rss-mb', type=float, default=None,
+                        help="falla si la RSS mediana supera este valor")
+    parser.add_argument('--allow-heavy', action='store_true',
+                        help="no fallar si alguna dependencia pesada se carga al importar")
+    parser.add_argument('--output', help="guarda el resultado en un archivo JSON")
+    args = parser.parse_args(argv)
+
+    result = measure(args.runs)
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(result, fh, indent=2)
+
+    errors = []
+    if args.max_import_ms is not None and result['import_ms_median'] > args.max_import_ms:
+        errors.append(f"import {result['import_ms_median']} ms > {args.max_import_ms} ms")
+    if args.max_rss_mb is not None and result['rss_mb_median'] and result['rss_mb_median'] > args.max_rss_mb:
+        errors.append(f"RSS {result['rss_mb_median']} MB > {args.max_rss_mb} MB")
+    if result['heavy_loaded'] and not args.allow_heavy:
+        errors.append(f"dependencias pesadas cargadas al arrancar: {', '.join(result['heavy_loaded'])}")
+    for error in errors:
+        print(f"REGRESION: {error}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())